@@ -1,5 +1,7 @@
 import os
 
+from strtobool import strtobool
+
 
 class Config(object):
     DEBUG = False
@@ -26,6 +28,11 @@ class Config(object):
     SEND_EMAIL_TO_GOV_NOTIFY = os.getenv("SEND_EMAIL_TO_GOV_NOTIFY", True)
     PUBSUB_TOPIC = os.getenv("PUBSUB_TOPIC", "ras-rm-notify-test")
     GOOGLE_CLOUD_PROJECT = os.getenv("GOOGLE_CLOUD_PROJECT", "test-project-id")
+    # "thread" or "process", sized to the number of CPUs unless PASSWORD_HASHING_WORKERS is set
+    PASSWORD_HASHING_EXECUTOR = os.getenv("PASSWORD_HASHING_EXECUTOR", "thread")
+    PASSWORD_HASHING_WORKERS = os.getenv("PASSWORD_HASHING_WORKERS")
+    # Refuse logins to locked or force deleted accounts before spending a bcrypt check on the password
+    LOGIN_FAST_REJECT = strtobool(os.getenv("LOGIN_FAST_REJECT", "True"))
 
 
 class DevelopmentConfig(Config):
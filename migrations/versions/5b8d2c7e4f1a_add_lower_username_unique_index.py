@@ -0,0 +1,50 @@
+"""add lower(username) unique index
+
+Revision ID: 5b8d2c7e4f1a
+Revises: a2ab8f75df9c
+Create Date: 2026-10-18 09:12:31.204518
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b8d2c7e4f1a"
+down_revision = "a2ab8f75df9c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # A unique index can't be built while usernames exist that only differ by case, so fail with a clear message
+    # rather than leaving an invalid index behind from the concurrent build.
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text("SELECT count(*) FROM (SELECT 1 FROM auth.user GROUP BY lower(username) HAVING count(*) > 1) d")
+        )
+        .scalar()
+    )
+    if duplicates:
+        raise RuntimeError(
+            f"{duplicates} usernames differ only by case in auth.user, these need resolving before the "
+            "lower(username) unique index can be created"
+        )
+
+    # Built concurrently so logins are not blocked while the index is created on a large table
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_username_lower",
+            "user",
+            [sa.text("lower(username)")],
+            unique=True,
+            schema="auth",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_user_username_lower", table_name="user", schema="auth", postgresql_concurrently=True)
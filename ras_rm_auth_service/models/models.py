@@ -3,11 +3,23 @@ from datetime import UTC, datetime, timezone
 
 import bcrypt
 from marshmallow import Schema, fields, validate
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text, func
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    inspect,
+    update,
+)
 from sqlalchemy.orm import declarative_base
 from structlog import wrap_logger
 from werkzeug.exceptions import Unauthorized
 
+from ras_rm_auth_service import password_hashing
 from strtobool import strtobool
 
 ACCOUNT_NOT_VERIFIED = "User account not verified"
@@ -38,7 +50,18 @@ class User(Base):
     force_delete = Column(Boolean, default=False)
     account_verification_date = Column(DateTime, default=None, nullable=True)
 
-    def update_user(self, update_params):
+    # Logins and account lookups match usernames case-insensitively, so both the lookup and the uniqueness of a
+    # username are served by an index on lower(username) rather than the case-sensitive unique constraint.
+    __table_args__ = (Index("ix_user_username_lower", func.lower(username), unique=True),)
+
+    @classmethod
+    def username_matches(cls, username):
+        """Case-insensitive username filter which can be answered from the lower(username) index"""
+        return func.lower(cls.username) == func.lower(username)
+
+    def update_user(self, update_params, hashed_password=None):
+        """Updates the account from the request parameters. A password can be hashed ahead of time with
+        hash_password, so that bcrypt doesn't run while the account row is held in an open transaction"""
         self.username = update_params.get("new_username", self.username)
 
         if "account_verified" in update_params:
@@ -47,7 +70,10 @@ class User(Base):
             if self.mark_for_deletion and not self.force_delete:
                 self.mark_for_deletion = False
 
-        if "password" in update_params:
+        if hashed_password:
+            logger.info("Changing password for account", user_id=id)
+            self.hashed_password = hashed_password
+        elif "password" in update_params:
             self.set_hashed_password(update_params["password"])
 
         if "account_locked" in update_params and not strtobool(update_params["account_locked"]):
@@ -73,13 +99,33 @@ class User(Base):
 
     def set_hashed_password(self, string_password):
         logger.info("Changing password for account", user_id=id)
-        self.hashed_password = bcrypt.hashpw(string_password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+        self.hashed_password = self.hash_password(string_password)
+
+    @staticmethod
+    def hash_password(string_password):
+        return password_hashing.run(bcrypt.hashpw, string_password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
 
     def is_correct_password(self, string_password):
-        return bcrypt.checkpw(string_password.encode("utf8"), self.hashed_password.encode("utf8"))
+        return password_hashing.run(bcrypt.checkpw, string_password.encode("utf8"), self.hashed_password.encode("utf8"))
 
-    def authorise(self, password):
-        if not self.is_correct_password(password):
+    def authorise(self, password, fast_reject=False):
+        if fast_reject:
+            self.reject_if_locked_or_deleted()
+        return self.apply_password_check(self.is_correct_password(password))
+
+    def reject_if_locked_or_deleted(self):
+        """Refuses a login to a locked or force deleted account without checking the password or changing the
+        account, as neither outcome of the password check could let the login through"""
+        if self.account_locked:
+            raise Unauthorized(description=USER_ACCOUNT_LOCKED)
+
+        if self.force_delete:
+            raise Unauthorized(description=USER_ACCOUNT_DELETED)
+
+    def apply_password_check(self, password_correct):
+        """Applies the result of checking the password to the login columns of this account.
+        Raises Unauthorized if the login is refused"""
+        if not password_correct:
             self.failed_login()
 
             if self.account_locked:
@@ -102,6 +148,21 @@ class User(Base):
 
         return True
 
+    def save_login_outcome(self, session):
+        """Writes the login columns changed by apply_password_check back in a single UPDATE, for an account read in an
+        earlier, already closed session. The update only applies while the password hash is the one that was checked,
+        so returns False if the password was changed or the account removed in the meantime"""
+        changes = {attr.key: attr.value for attr in inspect(self).attrs if attr.history.has_changes()}
+        if not changes:
+            return True
+        result = session.execute(
+            update(User)
+            .where(User.id == self.id, User.hashed_password == self.hashed_password)
+            .values(changes)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
     def update_last_login_date(self):
         self.last_login_date = datetime.now(timezone.utc)
 
@@ -0,0 +1,124 @@
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Lock
+
+import structlog
+
+logger = structlog.wrap_logger(logging.getLogger(__name__))
+
+THREAD = "thread"
+PROCESS = "process"
+
+
+def _gevent_patched():
+    try:
+        from gevent import monkey
+    except ImportError:
+        return False
+    return monkey.is_module_patched("threading")
+
+
+def _timed(fn, *args):
+    """Runs fn in the worker, returning when it started alongside its result so the queue wait can be measured"""
+    return time.time(), fn(*args)
+
+
+class HashingExecutor:
+    """Runs bcrypt hashing and verification on a bounded pool of workers rather than on the request worker.
+
+    Under gevent the work goes to a pool of native threads and the calling greenlet waits cooperatively, so other
+    requests keep being served while a password is hashed. bcrypt releases the GIL, so a thread pool hashes in
+    parallel; a process pool is available for sync workers but isn't used under gevent.
+    """
+
+    def __init__(self, kind=THREAD, max_workers=None):
+        if kind not in (THREAD, PROCESS):
+            raise ValueError(f"Unknown password hashing executor '{kind}'")
+        self.gevent = _gevent_patched()
+        if kind == PROCESS and self.gevent:
+            logger.warning("Process pool password hashing isn't supported under gevent, using a thread pool")
+            kind = THREAD
+        self.kind = kind
+        self.max_workers = int(max_workers) if max_workers else os.cpu_count() or 1
+        self._pool = None
+        self._lock = Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _get_pool(self):
+        # Created on first use so that a process pool isn't forked before the gunicorn workers are
+        with self._lock:
+            if self._pool is None:
+                if self.gevent:
+                    from gevent.threadpool import ThreadPool
+
+                    self._pool = ThreadPool(self.max_workers)
+                elif self.kind == PROCESS:
+                    self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bcrypt")
+            return self._pool
+
+    def run(self, fn, *args):
+        pool = self._get_pool()
+        submitted = time.time()
+        with self._lock:
+            self._in_flight += 1
+        try:
+            if self.gevent:
+                started, result = pool.spawn(_timed, fn, *args).get()
+            else:
+                started, result = pool.submit(_timed, fn, *args).result()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+        wait = max(started - submitted, 0.0)
+        with self._lock:
+            self._completed += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+        return result
+
+    def stats(self):
+        with self._lock:
+            return {
+                "executor": self.kind,
+                "gevent": self.gevent,
+                "max_workers": self.max_workers,
+                "in_flight": self._in_flight,
+                "queue_depth": max(self._in_flight - self.max_workers, 0),
+                "completed": self._completed,
+                "average_wait_seconds": self._total_wait / self._completed if self._completed else 0.0,
+                "max_wait_seconds": self._max_wait,
+            }
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None:
+                if self.gevent:
+                    self._pool.kill()
+                else:
+                    self._pool.shutdown(wait=False)
+                self._pool = None
+
+
+executor = HashingExecutor()
+
+
+def configure(kind=THREAD, max_workers=None):
+    global executor
+    executor.shutdown()
+    executor = HashingExecutor(kind, max_workers)
+    logger.info("Password hashing executor configured", executor=executor.kind, max_workers=executor.max_workers)
+
+
+def run(fn, *args):
+    return executor.run(fn, *args)
+
+
+def stats():
+    return executor.stats()
@@ -3,7 +3,6 @@ import logging
 import structlog
 from flask import Blueprint, jsonify, make_response, request
 from marshmallow import EXCLUDE, RAISE, ValidationError
-from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm.exc import NoResultFound
 
@@ -81,9 +80,12 @@ def put_account():
             jsonify({"title": "Auth service account update user error", "detail": "Missing 'username'"}), 400
         )
 
+    # Hashed before the account is read, so bcrypt doesn't run while the row is held in an open transaction
+    hashed_password = User.hash_password(put_params["password"]) if "password" in put_params else None
+
     try:
         with transactional_session() as session:
-            user = session.query(User).filter(User.username == username).first()
+            user = session.query(User).filter(User.username_matches(username)).first()
 
             if not user:
                 logger.info("User does not exist")
@@ -97,7 +99,7 @@ def put_account():
                     401,
                 )
 
-            user.update_user(put_params)
+            user.update_user(put_params, hashed_password=hashed_password)
     except ValueError as ex:
         logger.info("Request param is an invalid type", exc_info=ex)
         return make_response(
@@ -129,7 +131,7 @@ def get_account_by_user_name(username):
     """
     try:
         with transactional_session() as session:
-            user = session.query(User).filter(func.lower(User.username) == username.lower()).one()
+            user = session.query(User).filter(User.username_matches(username)).one()
     except NoResultFound:
         logger.info("User does not exist", username=obfuscate_email(username))
         return make_response(
@@ -160,7 +162,7 @@ def patch_account(username):
         )
     try:
         with transactional_session() as session:
-            user = session.query(User).filter(func.lower(User.username) == username.lower()).one()
+            user = session.query(User).filter(User.username_matches(username)).one()
             user.patch_user(patch_data)
 
     except NoResultFound:
@@ -197,7 +199,7 @@ def delete_account():
         username = params["username"]
         logger.info("Deleting user", username=obfuscate_email(username))
         with transactional_session() as session:
-            user = session.query(User).filter(func.lower(User.username) == username.lower()).one()
+            user = session.query(User).filter(User.username_matches(username)).one()
             user.mark_for_deletion = True
             if "force_delete" in params.keys():
                 user.force_delete = strtobool(params["force_delete"])
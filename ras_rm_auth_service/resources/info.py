@@ -3,6 +3,9 @@ import os
 
 from flask import Blueprint, current_app, jsonify, make_response
 
+from ras_rm_auth_service import password_hashing
+from ras_rm_auth_service.basic_auth import auth
+
 info_view = Blueprint("info_view", __name__)
 
 
@@ -20,3 +23,11 @@ def get_info():
     info = dict(git_info, **app_info)
 
     return make_response(jsonify(info), 200)
+
+
+@info_view.route("/metrics", methods=["GET"])
+@auth.login_required
+def get_metrics():
+    metrics = {"password_hashing": password_hashing.stats()}
+
+    return make_response(jsonify(metrics), 200)
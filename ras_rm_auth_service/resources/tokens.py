@@ -1,15 +1,19 @@
 import logging
 
 import structlog
-from flask import Blueprint, jsonify, make_response, request
+from flask import Blueprint, current_app, jsonify, make_response, request
 from marshmallow import EXCLUDE, ValidationError
-from sqlalchemy import func
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import load_only
 from werkzeug.exceptions import Unauthorized
 
 from ras_rm_auth_service.basic_auth import auth
 from ras_rm_auth_service.db_session_handlers import transactional_session
-from ras_rm_auth_service.models.models import AccountSchema, User
+from ras_rm_auth_service.models.models import (
+    UNAUTHORIZED_USER_CREDENTIALS,
+    AccountSchema,
+    User,
+)
 
 logger = structlog.wrap_logger(logging.getLogger(__name__))
 
@@ -19,6 +23,16 @@ account_schema = AccountSchema(unknown=EXCLUDE)
 
 AUTH_TOKEN_ERROR = "Auth service tokens error"
 
+# The columns read to decide a login, rather than the full account row
+LOGIN_COLUMNS = (
+    User.id,
+    User.hashed_password,
+    User.account_verified,
+    User.account_locked,
+    User.failed_logins,
+    User.force_delete,
+)
+
 
 @tokens.before_request
 @auth.login_required
@@ -50,32 +64,61 @@ def post_token():
     try:
         with transactional_session() as session:
             bound_logger.info("Searching for user")
-            user = session.query(User).filter(func.lower(User.username) == func.lower(payload.get("username"))).first()
-
-            if not user:
-                bound_logger.info("User does not exist")
-                return make_response(
-                    jsonify(
-                        {
-                            "title": AUTH_TOKEN_ERROR,
-                            "detail": "Unauthorized user credentials. This user does not exist on the Auth server",
-                        }
-                    ),
-                    401,
-                )
-
-            bound_logger.info("User found")
-            try:
-                user.authorise(payload.get("password"))
-            except Unauthorized as ex:
-                bound_logger.info("User is unauthorised", description=ex.description)
-                return make_response(jsonify({"title": AUTH_TOKEN_ERROR, "detail": ex.description}), 401)
-
-            logger.info("User credentials correct")
-            return make_response("", 204)
+            user = (
+                session.query(User)
+                .options(load_only(*LOGIN_COLUMNS))
+                .filter(User.username_matches(payload.get("username")))
+                .first()
+            )
     except SQLAlchemyError as e:
         return make_response(jsonify({"title": AUTH_TOKEN_ERROR, "detail": e.__class__.__name__}), 500)
 
+    if not user:
+        bound_logger.info("User does not exist")
+        return make_response(
+            jsonify(
+                {
+                    "title": AUTH_TOKEN_ERROR,
+                    "detail": "Unauthorized user credentials. This user does not exist on the Auth server",
+                }
+            ),
+            401,
+        )
+
+    bound_logger.info("User found")
+    if current_app.config["LOGIN_FAST_REJECT"]:
+        try:
+            user.reject_if_locked_or_deleted()
+        except Unauthorized as ex:
+            bound_logger.info("User is unauthorised", description=ex.description)
+            return make_response(jsonify({"title": AUTH_TOKEN_ERROR, "detail": ex.description}), 401)
+
+    # The session is closed before the password is checked, so the database connection goes back to the pool rather
+    # than sitting idle in a transaction for the duration of the bcrypt check
+    password_correct = user.is_correct_password(payload.get("password"))
+    unauthorised = None
+    try:
+        user.apply_password_check(password_correct)
+    except Unauthorized as ex:
+        unauthorised = ex
+
+    try:
+        with transactional_session() as session:
+            saved = user.save_login_outcome(session)
+    except SQLAlchemyError as e:
+        return make_response(jsonify({"title": AUTH_TOKEN_ERROR, "detail": e.__class__.__name__}), 500)
+
+    if unauthorised:
+        bound_logger.info("User is unauthorised", description=unauthorised.description)
+        return make_response(jsonify({"title": AUTH_TOKEN_ERROR, "detail": unauthorised.description}), 401)
+
+    if not saved:
+        bound_logger.info("User changed while checking credentials")
+        return make_response(jsonify({"title": AUTH_TOKEN_ERROR, "detail": UNAUTHORIZED_USER_CREDENTIALS}), 401)
+
+    logger.info("User credentials correct")
+    return make_response("", 204)
+
 
 def obfuscate_email(email):
     """Takes an email address and returns an obfuscated version of it.
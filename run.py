@@ -11,6 +11,7 @@ from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.sql import exists, select
 from structlog import wrap_logger
 
+from ras_rm_auth_service import password_hashing
 from ras_rm_auth_service.logger_config import logger_initial_config
 
 logger = wrap_logger(logging.getLogger(__name__))
@@ -26,6 +27,8 @@ def create_app(config=None):
 
     app.url_map.strict_slashes = False
 
+    password_hashing.configure(app.config["PASSWORD_HASHING_EXECUTOR"], app.config["PASSWORD_HASHING_WORKERS"])
+
     from ras_rm_auth_service.batch_process_endpoints import batch
     from ras_rm_auth_service.resources.account import (
         account,  # NOQA # pylint: disable=wrong-import-position
@@ -68,6 +68,30 @@ class TestAccount(unittest.TestCase):
             },
         )
 
+    def test_user_create_email_conflict_with_different_case(self):
+        """
+        Given a user account has been created
+        When another account is being created with the same email in a different case
+        Then a server error is thrown
+        """
+        # Given
+        form_data = {"username": "testuser@email.com", "password": "password"}
+        self.client.post("/api/account/create", data=form_data, headers=self.headers)
+
+        # When
+        form_data = {"username": "TestUser@Email.com", "password": "password"}
+        response = self.client.post("/api/account/create", data=form_data, headers=self.headers)
+
+        # Then
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(
+            response.get_json(),
+            {
+                "title": "Auth service account create error",
+                "detail": "Unable to create account with requested username",
+            },
+        )
+
     def test_user_create_bad_request(self):
         """
         Test create user end point with bad request
@@ -99,6 +123,24 @@ class TestAccount(unittest.TestCase):
         # Then
         self.assertEqual(response.status_code, 201)
 
+    def test_user_can_be_verified_with_case_insensitive_email(self):
+        """
+        Given a user account has been created but not verified
+        When I verify the account using a differently cased email
+        Then user is verified
+        """
+        # Given
+        form_data = {"username": "testuser@email.com", "password": "password"}
+        self.client.post("/api/account/create", data=form_data, headers=self.headers)
+
+        # When
+        form_data = {"username": "TestUser@Email.com", "account_verified": "true"}
+        response = self.client.put("/api/account/create", data=form_data, headers=self.headers)
+
+        # Then
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.get_json(), {"account": "testuser@email.com", "updated": "success"})
+
     def test_cannot_verify_a_user_that_does_not_exist(self):
         """
         Given no accounts exist
@@ -1,3 +1,4 @@
+import base64
 import json
 import os
 import unittest
@@ -15,6 +16,8 @@ class TestInfo(unittest.TestCase):
     def setUp(self):
         app = create_app("TestingConfig")
         self.client = app.test_client()
+        auth = "{}:{}".format("admin", "secret").encode("utf-8")
+        self.headers = {"Authorization": "Basic %s" % base64.b64encode(bytes(auth)).decode("ascii")}
         self.delete_git_info()
 
     def tearDown(self):
@@ -41,3 +44,17 @@ class TestInfo(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response_data["name"], "ras-rm-auth-service")
         self.assertEqual(response_data["test"], "test")
+
+    def test_metrics(self):
+        response = self.client.get("/metrics", headers=self.headers)
+        response_data = json.loads(response.data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response_data["password_hashing"]["executor"], "thread")
+        self.assertIn("queue_depth", response_data["password_hashing"])
+        self.assertIn("average_wait_seconds", response_data["password_hashing"])
+
+    def test_metrics_requires_basic_auth(self):
+        response = self.client.get("/metrics")
+
+        self.assertEqual(response.status_code, 401)
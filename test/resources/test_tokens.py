@@ -5,6 +5,7 @@ from unittest.mock import patch
 from sqlalchemy.exc import SQLAlchemyError
 
 from ras_rm_auth_service.models import models
+from ras_rm_auth_service.models.models import User
 from ras_rm_auth_service.resources.tokens import obfuscate_email
 from run import create_app
 
@@ -17,11 +18,11 @@ MISSING_USERNAME_PASSWORD = "Missing 'username' or 'password'"
 
 class TestTokens(unittest.TestCase):
     def setUp(self):
-        app = create_app("TestingConfig")
-        models.Base.metadata.drop_all(app.db)
-        models.Base.metadata.create_all(app.db)
-        app.db.session.commit()
-        self.client = app.test_client()
+        self.app = create_app("TestingConfig")
+        models.Base.metadata.drop_all(self.app.db)
+        models.Base.metadata.create_all(self.app.db)
+        self.app.db.session.commit()
+        self.client = self.app.test_client()
 
         auth = "{}:{}".format("admin", "secret").encode("utf-8")
         self.headers = {"Authorization": "Basic %s" % base64.b64encode(bytes(auth)).decode("ascii")}
@@ -206,6 +207,116 @@ class TestTokens(unittest.TestCase):
         self.assertEqual(response.status_code, 401)
         self.assertEqual(response.get_json(), {"title": AUTH_TOKEN_ERROR, "detail": "User account locked"})
 
+    def test_locked_account_rejected_without_checking_password(self):
+        """
+        Given a verified user has been locked after 10 failed attempts
+        When I login again
+        Then the password isn't checked and the failed attempt isn't recorded
+        """
+        # Given
+        form_data = {"username": TEST_USER_EMAIL, "password": "password"}
+        self.client.post(ACCOUNT_CREATE_URL, data=form_data, headers=self.headers)
+
+        form_data = {"username": TEST_USER_EMAIL, "account_verified": "true"}
+        self.client.put(ACCOUNT_CREATE_URL, data=form_data, headers=self.headers)
+
+        form_data = {"username": TEST_USER_EMAIL, "password": "wrongpassword"}
+        for _ in range(10):
+            self.client.post(TOKENS_URL, data=form_data, headers=self.headers)
+
+        # When
+        with patch.object(User, "is_correct_password") as mock_check:
+            response = self.client.post(TOKENS_URL, data=form_data, headers=self.headers)
+
+        # Then
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.get_json(), {"title": AUTH_TOKEN_ERROR, "detail": "User account locked"})
+        mock_check.assert_not_called()
+        user = self.app.db.session.query(User).filter(User.username == TEST_USER_EMAIL).one()
+        self.assertEqual(10, user.failed_logins)
+
+    def test_force_deleted_account_rejected_without_checking_password(self):
+        """
+        Given a verified user has been force deleted
+        When I login
+        Then the password isn't checked and the login is rejected
+        """
+        # Given
+        form_data = {"username": TEST_USER_EMAIL, "password": "password"}
+        self.client.post(ACCOUNT_CREATE_URL, data=form_data, headers=self.headers)
+
+        form_data = {"username": TEST_USER_EMAIL, "account_verified": "true"}
+        self.client.put(ACCOUNT_CREATE_URL, data=form_data, headers=self.headers)
+        self.client.delete(
+            "/api/account/user", data={"username": TEST_USER_EMAIL, "force_delete": "true"}, headers=self.headers
+        )
+
+        # When
+        with patch.object(User, "is_correct_password") as mock_check:
+            form_data = {"username": TEST_USER_EMAIL, "password": "password"}
+            response = self.client.post(TOKENS_URL, data=form_data, headers=self.headers)
+
+        # Then
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.get_json(), {"title": AUTH_TOKEN_ERROR, "detail": "User account deleted"})
+        mock_check.assert_not_called()
+
+    def test_locked_account_password_checked_when_fast_reject_disabled(self):
+        """
+        Given a verified user has been locked after 10 failed attempts and fast reject is disabled
+        When I login again
+        Then the password is checked and the failed attempt is recorded
+        """
+        # Given
+        self.app.config["LOGIN_FAST_REJECT"] = False
+        form_data = {"username": TEST_USER_EMAIL, "password": "password"}
+        self.client.post(ACCOUNT_CREATE_URL, data=form_data, headers=self.headers)
+
+        form_data = {"username": TEST_USER_EMAIL, "account_verified": "true"}
+        self.client.put(ACCOUNT_CREATE_URL, data=form_data, headers=self.headers)
+
+        form_data = {"username": TEST_USER_EMAIL, "password": "wrongpassword"}
+        for _ in range(10):
+            self.client.post(TOKENS_URL, data=form_data, headers=self.headers)
+
+        # When
+        response = self.client.post(TOKENS_URL, data=form_data, headers=self.headers)
+
+        # Then
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.get_json(), {"title": AUTH_TOKEN_ERROR, "detail": "User account locked"})
+        user = self.app.db.session.query(User).filter(User.username == TEST_USER_EMAIL).one()
+        self.assertEqual(11, user.failed_logins)
+
+    def test_login_rejected_when_password_changes_during_check(self):
+        """
+        Given a verified user exists
+        When the password is changed while a login is checking the old password
+        Then the login is rejected
+        """
+        # Given
+        form_data = {"username": TEST_USER_EMAIL, "password": "password"}
+        self.client.post(ACCOUNT_CREATE_URL, data=form_data, headers=self.headers)
+
+        form_data = {"username": TEST_USER_EMAIL, "account_verified": "true"}
+        self.client.put(ACCOUNT_CREATE_URL, data=form_data, headers=self.headers)
+
+        def change_password(*_):
+            self.app.db.session.query(User).filter(User.username == TEST_USER_EMAIL).update(
+                {"hashed_password": User.hash_password("anotherpassword")}
+            )
+            self.app.db.session.commit()
+            return True
+
+        # When
+        with patch.object(User, "is_correct_password", side_effect=change_password):
+            form_data = {"username": TEST_USER_EMAIL, "password": "password"}
+            response = self.client.post(TOKENS_URL, data=form_data, headers=self.headers)
+
+        # Then
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.get_json(), {"title": AUTH_TOKEN_ERROR, "detail": "Unauthorized user credentials"})
+
     def test_post_tokens_empty_password_bad_request(self):
         """
         Given a user exists
@@ -162,6 +162,21 @@ class TestModel(unittest.TestCase):
         self.assertEqual("User account locked", err.exception.description)
         self.assertEqual(MAX_FAILED_LOGINS, user.failed_logins)
 
+    def test_apply_password_check_failed_increments_failed_logins(self):
+        user = User(account_locked=False, account_verified=True, failed_logins=0)
+
+        with self.assertRaises(Unauthorized) as err:
+            user.apply_password_check(False)
+
+        self.assertEqual("Unauthorized user credentials", err.exception.description)
+        self.assertEqual(1, user.failed_logins)
+
+    def test_update_user_with_prehashed_password(self):
+        user = User(username="test", hashed_password="h4$HedPassword")
+        hashed_password = User.hash_password("newpassword")
+        user.update_user({"password": "newpassword"}, hashed_password=hashed_password)
+        self.assertEqual(hashed_password, user.hashed_password)
+
     def test_authorise_correct_password_but_user_is_locked(self):
         password = "password"
         user = User(
@@ -176,6 +191,15 @@ class TestModel(unittest.TestCase):
 
         self.assertEqual("User account locked", err.exception.description)
 
+    def test_authorise_fast_reject_locked_user_does_not_check_password(self):
+        user = User(account_locked=True, account_verified=True, hashed_password="not-a-bcrypt-hash", failed_logins=10)
+
+        with self.assertRaises(Unauthorized) as err:
+            user.authorise("wrongpassword", fast_reject=True)
+
+        self.assertEqual("User account locked", err.exception.description)
+        self.assertEqual(10, user.failed_logins)
+
     def test_authorise_correct_password_but_user_is_not_verified(self):
         password = "password"
         user = User(
@@ -0,0 +1,50 @@
+import unittest
+from unittest.mock import patch
+
+import bcrypt
+
+from ras_rm_auth_service.password_hashing import HashingExecutor
+
+
+class TestPasswordHashing(unittest.TestCase):
+    def test_thread_executor_runs_on_pool(self):
+        executor = HashingExecutor("thread", 2)
+        hashed = executor.run(bcrypt.hashpw, b"password", bcrypt.gensalt(4))
+
+        self.assertTrue(bcrypt.checkpw(b"password", hashed))
+        stats = executor.stats()
+        self.assertEqual("thread", stats["executor"])
+        self.assertEqual(2, stats["max_workers"])
+        self.assertEqual(1, stats["completed"])
+        self.assertEqual(0, stats["in_flight"])
+        self.assertEqual(0, stats["queue_depth"])
+        executor.shutdown()
+
+    def test_process_executor_runs_on_pool(self):
+        executor = HashingExecutor("process", 1)
+        hashed = bcrypt.hashpw(b"password", bcrypt.gensalt(4))
+
+        self.assertTrue(executor.run(bcrypt.checkpw, b"password", hashed))
+        self.assertFalse(executor.run(bcrypt.checkpw, b"wrongpassword", hashed))
+        self.assertEqual(2, executor.stats()["completed"])
+        executor.shutdown()
+
+    def test_gevent_executor_runs_on_native_thread_pool(self):
+        with patch("ras_rm_auth_service.password_hashing._gevent_patched", return_value=True):
+            executor = HashingExecutor("process", 2)
+        hashed = bcrypt.hashpw(b"password", bcrypt.gensalt(4))
+
+        self.assertTrue(executor.run(bcrypt.checkpw, b"password", hashed))
+        stats = executor.stats()
+        self.assertEqual("thread", stats["executor"])
+        self.assertTrue(stats["gevent"])
+        executor.shutdown()
+
+    def test_executor_defaults_to_cpu_count(self):
+        with patch("ras_rm_auth_service.password_hashing.os.cpu_count", return_value=3):
+            executor = HashingExecutor()
+        self.assertEqual(3, executor.max_workers)
+
+    def test_unknown_executor(self):
+        with self.assertRaises(ValueError):
+            HashingExecutor("fork")